@@ -0,0 +1,146 @@
+"""
+Async read API for the Expense Splitter
+
+An ASGI app serving the read endpoints (GET /expenses, /balances,
+/settlements and /analytics/*) on SQLAlchemy's asyncio extension, so a
+worker keeps answering other requests while one waits on the database. The
+responses are built by the same read_* functions as the Flask views, run on
+the async session through AsyncSession.run_sync(), with the same models and
+caches.
+
+The database is the app's DATABASE_URL with an async driver: aiosqlite for
+SQLite, asyncpg for PostgreSQL (set ASYNC_DATABASE_URL to use another). The
+DB_* pool settings apply here as well. Writes stay on the Flask app, so run
+both behind one proxy, routing these GET paths here:
+
+  uvicorn --factory asgi:create_asgi_app --workers 4 --port 8000
+"""
+
+import os
+from urllib.parse import parse_qsl
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from werkzeug.datastructures import MultiDict
+
+from app import (
+    create_app,
+    read_balances,
+    read_category_analytics,
+    read_expenses,
+    read_monthly_analytics,
+    read_people_analytics,
+    read_settlements,
+)
+
+READ_ROUTES = {
+    "/expenses": read_expenses,
+    "/balances": read_balances,
+    "/settlements": read_settlements,
+    "/analytics/categories": read_category_analytics,
+    "/analytics/monthly": read_monthly_analytics,
+    "/analytics/people": read_people_analytics,
+}
+
+# Async driver used for each backend when the URL doesn't name one
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def async_database_url(app):
+    """The app's database URL with an async driver"""
+    url = make_url(
+        os.getenv("ASYNC_DATABASE_URL") or app.config["SQLALCHEMY_DATABASE_URI"]
+    )
+    backend = url.get_backend_name()
+    if url.get_driver_name() not in ASYNC_DRIVERS.values():
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+    # Flask-SQLAlchemy puts relative SQLite paths in the instance folder
+    if backend == "sqlite" and url.database not in (None, "", ":memory:"):
+        if not os.path.isabs(url.database):
+            url = url.set(database=os.path.join(app.instance_path, url.database))
+    return url
+
+
+def async_engine_options(app, url):
+    """The app's pool settings, minus what only applies to the sync drivers"""
+    options = {
+        key: value
+        for key, value in app.config["SQLALCHEMY_ENGINE_OPTIONS"].items()
+        if key != "connect_args"
+    }
+    statement_timeout = int(os.getenv("DB_STATEMENT_TIMEOUT", "0"))
+    if statement_timeout and url.get_backend_name() == "postgresql":
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(statement_timeout)}
+        }
+    return options
+
+
+class AsyncReadAPI:
+    """ASGI app answering the READ_ROUTES paths from an async engine"""
+
+    def __init__(self, app):
+        self.app = app
+        url = async_database_url(app)
+        self.engine = create_async_engine(url, **async_engine_options(app, url))
+        self.sessions = async_sessionmaker(self.engine)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        read = READ_ROUTES.get(scope["path"])
+        if read is None:
+            body, status = {"success": False, "message": "Endpoint not found"}, 404
+        elif scope["method"] not in ("GET", "HEAD"):
+            body, status = {"success": False, "message": "Method not allowed"}, 405
+        else:
+            query = scope["query_string"].decode("latin-1")
+            args = MultiDict(parse_qsl(query, keep_blank_values=True))
+            body, status = await self.read(read, args)
+
+        payload = self.app.json.dumps(body).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(payload)).encode()),
+                ],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b"" if scope["method"] == "HEAD" else payload,
+            }
+        )
+
+    async def read(self, read, args):
+        """Run one read_* function on an async session, inside an app context
+        so it sees the app's config"""
+        with self.app.app_context():
+            async with self.sessions() as session:
+                return await session.run_sync(
+                    lambda sync_session: read(args, sync_session)
+                )
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.engine.dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app(config=None):
+    """Create the async read API; config is passed on to create_app()"""
+    return AsyncReadAPI(create_app(config))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Async read API benchmark
+
+Seeds N expenses and serves the same database twice: the Flask app under
+gunicorn sync workers, and the async read API (asgi.py) under uvicorn, each
+with --workers processes. C concurrent clients then send a mix of read
+requests (GET /expenses?limit=50, /balances and /analytics/categories) for
+--seconds. Reports requests per second and request latency per server and
+concurrency level.
+
+Needs gunicorn, uvicorn and the async driver for the database (aiosqlite or
+asyncpg). Every request opens a new connection, since gunicorn's sync
+workers don't keep connections alive.
+
+Usage:
+  python benchmarks/bench_async.py --concurrency 1,16,64 --workers 2
+  BENCH_DATABASE_URL=postgresql://localhost/bench python benchmarks/bench_async.py
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from common import app, db, parse_sizes, print_table, reset_schema, seed_expenses
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = ["/expenses?limit=50", "/balances", "/analytics/categories"]
+
+SERVERS = {
+    "wsgi (gunicorn)": lambda port, workers: [
+        "gunicorn",
+        "--workers",
+        str(workers),
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--log-level",
+        "warning",
+        "app:create_app()",
+    ],
+    "asgi (uvicorn)": lambda port, workers: [
+        "uvicorn",
+        "--factory",
+        "asgi:create_asgi_app",
+        "--workers",
+        str(workers),
+        "--port",
+        str(port),
+        "--log-level",
+        "warning",
+    ],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def fetch(port, path):
+    """Send one GET and return its status code"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode()
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return int(response.split(b" ", 2)[1])
+
+
+async def wait_until_up(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if await fetch(port, "/balances") == 200:
+                return
+        except (OSError, IndexError, ValueError):
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Server on port {port} did not start")
+        await asyncio.sleep(0.2)
+
+
+async def load(port, concurrency, seconds):
+    """Keep concurrency requests in flight for seconds; return latencies"""
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async def client(offset):
+        nonlocal errors
+        i = offset
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status = await fetch(port, PATHS[i % len(PATHS)])
+            latencies.append(time.perf_counter() - start)
+            errors += status != 200
+            i += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def run(name, command, concurrency_levels, seconds, workers, env):
+    port = free_port()
+    server = subprocess.Popen(command(port, workers), cwd=ROOT, env=env)
+    rows = []
+    try:
+        asyncio.run(wait_until_up(port))
+        for concurrency in concurrency_levels:
+            latencies, errors, elapsed = asyncio.run(load(port, concurrency, seconds))
+            latencies.sort()
+            rows.append(
+                [
+                    name,
+                    concurrency,
+                    len(latencies),
+                    errors,
+                    f"{len(latencies) / elapsed:.0f}",
+                    f"{latencies[len(latencies) // 2] * 1000:.1f}",
+                    f"{latencies[len(latencies) * 95 // 100] * 1000:.1f}",
+                ]
+            )
+    finally:
+        server.terminate()
+        server.wait()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", default="1,16,64", type=parse_sizes)
+    parser.add_argument("--seconds", default=5.0, type=float)
+    parser.add_argument("--workers", default=2, type=int)
+    parser.add_argument("--expenses", default=10000, type=int)
+    args = parser.parse_args()
+
+    with app.app_context():
+        reset_schema()
+        seed_expenses(args.expenses)
+        db.session.remove()
+    database_url = app.config["SQLALCHEMY_DATABASE_URI"]
+    print(f"Database: {database_url}")
+
+    env = dict(os.environ, DATABASE_URL=database_url)
+    env["PATH"] = os.pathsep.join(
+        [os.path.dirname(sys.executable), env.get("PATH", "")]
+    )
+    rows = []
+    for name, command in SERVERS.items():
+        rows.extend(
+            run(name, command, args.concurrency, args.seconds, args.workers, env)
+        )
+
+    print_table(
+        ["server", "concurrency", "requests", "errors", "req/s", "p50 ms", "p95 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
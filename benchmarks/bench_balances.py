@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Balance calculation benchmark
+
+Compares the original ORM walk (one lazy SELECT per expense for its splits)
+with the SQL aggregate engine and the ledger read, reporting query count
+and wall time per data size.
+
+Usage:
+  python benchmarks/bench_balances.py --sizes 10000,100000,1000000
+  BENCH_DATABASE_URL=postgresql://... python benchmarks/bench_balances.py
+"""
+
+import argparse
+from collections import defaultdict
+
+from common import (
+    QueryCounter,
+    app,
+    parse_sizes,
+    print_table,
+    reset_schema,
+    seed_expenses,
+    timed,
+)
+
+from app import Expense, aggregate_balances, calculate_balances, rebuild_ledger
+
+
+def orm_walk_balances():
+    """The pre-aggregate implementation: hydrate every expense and its splits"""
+    person_paid = defaultdict(int)
+    person_owes = defaultdict(int)
+    for expense in Expense.query.all():
+        person_paid[expense.paid_by] += expense.amount
+        for split in expense.splits:
+            person_owes[split.person_name] += split.calculated_amount
+    return person_paid, person_owes
+
+
+def run(size, orm_limit):
+    reset_schema()
+    seed_expenses(size)
+    rebuild_ledger()
+
+    rows = []
+    engines = [("sql aggregate", aggregate_balances), ("ledger", calculate_balances)]
+    if size <= orm_limit:
+        engines.insert(0, ("orm walk", orm_walk_balances))
+
+    results = {}
+    for name, func in engines:
+        with QueryCounter() as counter, timed(results, name):
+            func()
+        rows.append([size, name, counter.count, f"{results[name] * 1000:.1f}"])
+
+    assert aggregate_balances() == calculate_balances()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000", type=parse_sizes)
+    parser.add_argument(
+        "--orm-limit",
+        default=10000,
+        type=int,
+        help="Skip the ORM walk above this many expenses (it issues one query each)",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    with app.app_context():
+        print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+        for size in args.sizes:
+            rows.extend(run(size, args.orm_limit))
+
+    print_table(["expenses", "engine", "queries", "ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
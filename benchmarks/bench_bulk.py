@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Bulk expense ingestion benchmark
+
+Posts N generated expenses to POST /expenses/bulk in one request. Most carry
+three equal splits; every tenth has none and is shared with everyone known,
+which writes one split per person. With --single the same payload is also
+sent as individual POST /expenses calls for comparison.
+
+Usage:
+  python benchmarks/bench_bulk.py --sizes 1000,10000 --single 1000
+"""
+
+import argparse
+import random
+
+from common import (
+    QueryCounter,
+    app,
+    db,
+    parse_sizes,
+    print_table,
+    reset_schema,
+    timed,
+)
+
+
+def make_payload(count, people=200, seed=42):
+    """Generate count expense payloads referencing a pool of people"""
+    rng = random.Random(seed)
+    names = [f"Person{i}" for i in range(people)]
+    items = []
+    for i in range(count):
+        item = {
+            "amount": rng.randint(100, 100000) / 100,
+            "description": f"Card transaction {i}",
+            "paid_by": rng.choice(names),
+            "category": rng.choice(["Food", "Travel", "Utilities", "Other"]),
+        }
+        if i % 10:
+            item["splits"] = [
+                {"person_name": name, "split_type": "equal"}
+                for name in rng.sample(names, 3)
+            ]
+        items.append(item)
+    return items
+
+
+def run(name, client, items, send):
+    with app.app_context():
+        reset_schema()
+        db.session.remove()
+    results = {}
+    with app.app_context(), QueryCounter() as counter, timed(results, name):
+        send(client, items)
+    return [
+        name,
+        len(items),
+        counter.count,
+        f"{results[name]:.2f}",
+        f"{len(items) / results[name]:.0f}",
+    ]
+
+
+def send_bulk(client, items):
+    response = client.post("/expenses/bulk", json={"expenses": items})
+    assert response.status_code == 201, response.get_json()["message"]
+
+
+def send_single(client, items):
+    for item in items:
+        response = client.post("/expenses", json=item)
+        assert response.status_code == 201, response.get_json()["message"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000", type=parse_sizes)
+    parser.add_argument(
+        "--single",
+        default=0,
+        type=int,
+        help="Also send this many expenses one POST /expenses call at a time",
+    )
+    args = parser.parse_args()
+
+    client = app.test_client()
+    rows = []
+    if args.single:
+        rows.append(run("single", client, make_payload(args.single), send_single))
+    for size in args.sizes:
+        rows.append(run("bulk", client, make_payload(size), send_bulk))
+
+    print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+    print_table(["mode", "expenses", "queries", "seconds", "expenses/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Category analytics benchmark
+
+Compares the original implementation (load every expense in the window,
+then rescan the list once per category to count it), a GROUP BY over raw
+expense rows, and the daily rollup read behind /analytics/categories, over
+the whole history and over a one-month created_at window (best of three).
+
+Usage:
+  python benchmarks/bench_categories.py --sizes 10000,100000,1000000
+  python benchmarks/bench_categories.py --sizes 1000000 --people 5
+"""
+
+import argparse
+from collections import defaultdict
+from datetime import datetime
+
+from common import (
+    QueryCounter,
+    app,
+    db,
+    parse_sizes,
+    print_table,
+    reset_schema,
+    seed_expenses,
+    timed,
+)
+
+from sqlalchemy import func
+
+from app import (
+    DEFAULT_GROUP_ID,
+    Expense,
+    ExpenseCategory,
+    aggregate_categories,
+)
+
+WINDOWS = [
+    ("all", None, None),
+    ("1 month", datetime(2022, 6, 1), datetime(2022, 6, 30, 23, 59, 59)),
+]
+
+
+def python_categories(group_id=DEFAULT_GROUP_ID, start=None, end=None):
+    """The original implementation: hydrate and rescan per category"""
+    query = Expense.query.filter_by(group_id=group_id)
+    if start is not None:
+        query = query.filter(Expense.created_at >= start)
+    if end is not None:
+        query = query.filter(Expense.created_at <= end)
+    expenses = query.all()
+
+    def name(expense):
+        return (expense.category or ExpenseCategory.OTHER).value
+
+    category_totals = defaultdict(int)
+    total_spent = 0
+    for expense in expenses:
+        amount = expense.amount
+        category_totals[name(expense)] += amount
+        total_spent += amount
+
+    breakdown = {
+        category: (amount, len([e for e in expenses if name(e) == category]))
+        for category, amount in category_totals.items()
+    }
+    return breakdown, total_spent, len(expenses)
+
+
+def raw_group_by_categories(group_id=DEFAULT_GROUP_ID, start=None, end=None):
+    """GROUP BY straight over expense rows, before the daily rollup existed"""
+    query = db.session.query(
+        Expense.category, func.sum(Expense.amount), func.count()
+    ).filter(Expense.group_id == group_id)
+    if start is not None:
+        query = query.filter(Expense.created_at >= start)
+    if end is not None:
+        query = query.filter(Expense.created_at <= end)
+
+    category_totals = {}
+    for category, amount, count in query.group_by(Expense.category):
+        name = (category or ExpenseCategory.OTHER).value
+        total, seen = category_totals.get(name, (0, 0))
+        category_totals[name] = (total + amount, seen + count)
+    total_spent = sum(amount for amount, _ in category_totals.values())
+    return category_totals, total_spent, sum(c for _, c in category_totals.values())
+
+
+def run(size, people, python_limit):
+    reset_schema()
+    seed_expenses(size, people=people)
+    db.session.remove()
+
+    engines = [
+        ("raw group by", raw_group_by_categories),
+        ("daily rollup", aggregate_categories),
+    ]
+    if size <= python_limit:
+        engines.insert(0, ("python", python_categories))
+
+    rows = []
+    for window, start, end in WINDOWS:
+        answers = []
+        for name, engine in engines:
+            best = None
+            for _ in range(3):
+                results = {}
+                with QueryCounter() as counter, timed(results, name):
+                    answer = engine(DEFAULT_GROUP_ID, start, end)
+                db.session.remove()
+                best = min(best or results[name], results[name])
+            answers.append(answer)
+            rows.append([size, window, name, counter.count, f"{best * 1000:.1f}"])
+        assert all(answer == answers[-1] for answer in answers)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000", type=parse_sizes)
+    parser.add_argument(
+        "--people",
+        default=50,
+        type=int,
+        help="Distinct payers; fewer payers means fewer daily rollup rows",
+    )
+    parser.add_argument(
+        "--python-limit",
+        default=100000,
+        type=int,
+        help="Skip the original implementation above this many expenses",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    with app.app_context():
+        print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+        for size in args.sizes:
+            rows.extend(run(size, args.people, args.python_limit))
+
+    print_table(["expenses", "window", "engine", "queries", "ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Expense export benchmark
+
+Seeds N expenses and streams /expenses/export in each format, recording time
+to first chunk, total time, bytes written and peak Python heap (tracemalloc).
+Peak memory should stay roughly flat as N grows. With --list-limit the
+in-memory GET /expenses response is measured too for comparison.
+
+Usage:
+  python benchmarks/bench_export.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from common import app, db, parse_sizes, print_table, reset_schema, seed_expenses
+
+
+def consume(client, url):
+    """Read a response chunk by chunk; return (first chunk s, total s, bytes)"""
+    start = time.perf_counter()
+    response = client.get(url, buffered=False)
+    first = None
+    size = 0
+    for chunk in response.response:
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    response.close()
+    return first or total, total, size
+
+
+def peak_memory(client, url):
+    """Peak traced Python heap (MB) while consuming the response"""
+    tracemalloc.start()
+    consume(client, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000", type=parse_sizes)
+    parser.add_argument(
+        "--list-limit",
+        default=10000,
+        type=int,
+        help="Also measure GET /expenses when N is at most this (0 to skip)",
+    )
+    args = parser.parse_args()
+
+    client = app.test_client()
+    rows = []
+    for size in args.sizes:
+        with app.app_context():
+            reset_schema()
+            seed_expenses(size)
+            db.session.remove()
+
+        urls = [
+            ("export ndjson", "/expenses/export?format=ndjson"),
+            ("export csv", "/expenses/export?format=csv"),
+        ]
+        if size <= args.list_limit:
+            urls.append(("GET /expenses", "/expenses"))
+
+        for name, url in urls:
+            first, total, written = consume(client, url)
+            peak = peak_memory(client, url)
+            rows.append(
+                [
+                    name,
+                    size,
+                    f"{first * 1000:.1f}",
+                    f"{total:.2f}",
+                    f"{written / (1024 * 1024):.1f}",
+                    f"{peak:.1f}",
+                ]
+            )
+
+    with app.app_context():
+        print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+    print_table(
+        ["endpoint", "expenses", "first ms", "seconds", "MB out", "peak MB"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
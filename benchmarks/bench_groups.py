@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Group scoping benchmark
+
+Seeds G groups of N expenses each and times reads for a single group (best
+of three) as G grows. With every query led by group_id the timings should
+stay flat no matter how many other groups share the database.
+
+Usage:
+  python benchmarks/bench_groups.py --groups 1,10,100 --per-group 1000
+"""
+
+import argparse
+
+from common import (
+    QueryCounter,
+    app,
+    db,
+    parse_sizes,
+    print_table,
+    reset_schema,
+    seed_expenses,
+    timed,
+)
+
+from app import Group, aggregate_balances, balance_cache, rebuild_ledger
+
+READS = [
+    ("GET /expenses?limit=50", "/expenses?group_id={group}&limit=50"),
+    ("GET /balances (uncached)", "/balances?group_id={group}"),
+    ("GET /analytics/categories", "/analytics/categories?group_id={group}"),
+]
+
+
+def seed_groups(groups, per_group):
+    """Create groups 2..groups+1 and per_group expenses in each"""
+    db.session.add_all(Group(name=f"Group {i}") for i in range(groups))
+    db.session.commit()
+    for index in range(groups):
+        seed_expenses(
+            per_group,
+            group_id=index + 2,
+            first_id=index * per_group + 1,
+            seed=index,
+        )
+    rebuild_ledger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--groups", default="1,10,100", type=parse_sizes)
+    parser.add_argument("--per-group", default=1000, type=int)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    rows = []
+    for groups in args.groups:
+        with app.app_context():
+            reset_schema()
+            seed_groups(groups, args.per_group)
+            db.session.remove()
+
+        # Always read the same group so only the number of other groups changes.
+        # Best of three runs, after a warm-up request
+        for name, url in READS:
+            client.get(url.format(group=2))
+            best = None
+            for _ in range(3):
+                balance_cache.clear()
+                results = {}
+                with app.app_context(), QueryCounter() as counter, timed(results, name):
+                    response = client.get(url.format(group=2))
+                assert response.status_code == 200, response.get_json()
+                best = min(best or results[name], results[name])
+            rows.append([groups, name, counter.count, f"{best * 1000:.1f}"])
+
+        with app.app_context():
+            results = {}
+            with timed(results, "aggregate"):
+                aggregate_balances(2)
+            rows.append(
+                [groups, "aggregate_balances()", "", f"{results['aggregate'] * 1000:.1f}"]
+            )
+
+    print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+    print_table(["groups", "read", "queries", "ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Connection pool load test
+
+Seeds N expenses, then sends read requests (GET /expenses and GET /people)
+from T threads at once, each with its own test client, the way gunicorn
+threads share one worker's pool. Reports requests per second, request
+latency and the pool's checkout counters from GET /admin/pool-stats.
+
+The pool is configured from the DB_* variables when the app is imported, so
+set them on the command line. A small pool with no overflow shows requests
+queueing for connections (saturated checkouts and slower requests):
+  DB_POOL_SIZE=4 DB_MAX_OVERFLOW=0 python benchmarks/bench_pool.py --threads 1,4,16
+
+Usage:
+  python benchmarks/bench_pool.py --threads 1,8,32 --requests 200
+  BENCH_DATABASE_URL=postgresql://localhost/bench python benchmarks/bench_pool.py
+"""
+
+import argparse
+import threading
+import time
+
+from common import app, db, parse_sizes, print_table, reset_schema, seed_expenses
+
+from app import pool_stats
+
+PATHS = ["/expenses?limit=50", "/people"]
+
+
+def worker(count, latencies, errors, start):
+    client = app.test_client()
+    start.wait()
+    for i in range(count):
+        begin = time.perf_counter()
+        response = client.get(PATHS[i % len(PATHS)])
+        latencies.append(time.perf_counter() - begin)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+
+
+def run(threads, requests):
+    pool_stats.reset()
+    latencies = []
+    errors = []
+    start = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=worker, args=(requests, latencies, errors, start))
+        for _ in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    begin = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    seconds = time.perf_counter() - begin
+
+    stats = app.test_client().get("/admin/pool-stats").get_json()["data"]["stats"]
+    latencies.sort()
+    return [
+        threads,
+        len(latencies),
+        len(errors),
+        f"{len(latencies) / seconds:.0f}",
+        f"{latencies[len(latencies) // 2] * 1000:.1f}",
+        f"{latencies[len(latencies) * 95 // 100] * 1000:.1f}",
+        stats["peak_in_use"],
+        stats["overflow_checkouts"],
+        stats["saturated_checkouts"],
+        f"{stats['hold_ms']['p95']:.1f}",
+        f"{stats['hold_ms']['max']:.1f}",
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", default="1,8,32", type=parse_sizes)
+    parser.add_argument(
+        "--requests", default=200, type=int, help="Requests sent by each thread"
+    )
+    parser.add_argument("--expenses", default=1000, type=int)
+    args = parser.parse_args()
+
+    with app.app_context():
+        reset_schema()
+        seed_expenses(args.expenses)
+        db.session.remove()
+        options = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+        print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+        print(
+            f"Pool: size={options.get('pool_size')} "
+            f"max_overflow={options.get('max_overflow')} "
+            f"timeout={options.get('pool_timeout')}"
+        )
+
+    rows = [run(threads, args.requests) for threads in args.threads]
+    print_table(
+        [
+            "threads",
+            "requests",
+            "errors",
+            "req/s",
+            "p50 ms",
+            "p95 ms",
+            "peak in use",
+            "overflow",
+            "saturated",
+            "hold p95 ms",
+            "hold max ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Recurring catch-up benchmark
+
+Seeds N monthly templates that are years behind and times one
+process_recurring_transactions() run. With --legacy-templates the original
+one-ORM-add-per-occurrence loop is timed on a smaller set for comparison.
+
+Usage:
+  python benchmarks/bench_recurring.py --templates 10000 --years 5
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from common import QueryCounter, app, db, print_table, reset_schema, timed
+
+from app import (
+    Expense,
+    ExpenseCategory,
+    Person,
+    RecurrenceType,
+    RecurringTransaction,
+    add_equal_splits,
+    apply_to_ledger,
+    default_split_people,
+    get_occurrence_date,
+    process_recurring_transactions,
+    to_cents,
+)
+
+PEOPLE = ["Shantanu", "Sanket", "Om"]
+
+
+def seed_templates(count, years):
+    """Insert count monthly templates starting years ago"""
+    db.session.execute(Person.__table__.insert(), [{"name": name} for name in PEOPLE])
+    start = datetime.utcnow() - timedelta(days=365 * years)
+    db.session.execute(
+        RecurringTransaction.__table__.insert(),
+        [
+            {
+                "amount": to_cents(1500),
+                "description": f"Template {i}",
+                "paid_by": PEOPLE[i % len(PEOPLE)],
+                "category": ExpenseCategory.UTILITIES,
+                "recurrence_type": RecurrenceType.MONTHLY,
+                "start_date": start,
+                "next_due": get_occurrence_date(start, RecurrenceType.MONTHLY, 1),
+                "is_active": True,
+                "created_at": start,
+            }
+            for i in range(count)
+        ],
+    )
+    db.session.commit()
+
+
+def legacy_process():
+    """The original generation loop: one ORM expense per occurrence"""
+    now = datetime.utcnow()
+    for rt in RecurringTransaction.query.filter_by(is_active=True).all():
+        index = 1
+        next_date = get_occurrence_date(rt.start_date, rt.recurrence_type, index)
+        while next_date <= now:
+            expense = Expense(
+                amount=rt.amount,
+                description=f"{rt.description} (Auto-generated)",
+                paid_by=rt.paid_by,
+                category=rt.category,
+                created_at=next_date,
+                recurring_transaction_id=rt.id,
+            )
+            db.session.add(expense)
+            db.session.flush()
+            shares = add_equal_splits(expense, default_split_people(rt.paid_by))
+            apply_to_ledger(rt.paid_by, rt.amount, shares)
+            rt.last_generated = next_date
+            index += 1
+            next_date = get_occurrence_date(rt.start_date, rt.recurrence_type, index)
+    db.session.commit()
+
+
+def run(name, templates, years, func):
+    reset_schema()
+    seed_templates(templates, years)
+    results = {}
+    with QueryCounter() as counter, timed(results, name):
+        func()
+    expenses = Expense.query.count()
+    return [
+        name,
+        templates,
+        expenses,
+        counter.count,
+        f"{results[name]:.2f}",
+        f"{expenses / results[name]:.0f}",
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--templates", default=10000, type=int)
+    parser.add_argument("--years", default=5, type=int)
+    parser.add_argument(
+        "--legacy-templates",
+        default=0,
+        type=int,
+        help="Also time the per-occurrence loop on this many templates",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    with app.app_context():
+        print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+        if args.legacy_templates:
+            rows.append(run("legacy", args.legacy_templates, args.years, legacy_process))
+            rows.append(
+                run("bulk", args.legacy_templates, args.years, process_recurring_transactions)
+            )
+        rows.append(run("bulk", args.templates, args.years, process_recurring_transactions))
+
+    print_table(
+        ["mode", "templates", "expenses", "queries", "seconds", "expenses/s"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
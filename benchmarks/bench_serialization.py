@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+List serialization benchmark
+
+Seeds N expenses (three splits each) and builds the GET /expenses payload
+three ways: the original path (ORM objects with selectinload'ed splits,
+to_dict() and the stdlib encoder), plain column rows with the stdlib
+encoder, and plain column rows through the app's JSON provider (orjson when
+it is installed). Reports expenses serialized per second, best of three.
+
+Usage:
+  python benchmarks/bench_serialization.py --sizes 10000,100000
+"""
+
+import argparse
+import json
+
+from common import (
+    QueryCounter,
+    app,
+    db,
+    parse_sizes,
+    print_table,
+    reset_schema,
+    seed_expenses,
+    timed,
+)
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app import (
+    DEFAULT_GROUP_ID,
+    EXPENSE_ROW_COLUMNS,
+    Expense,
+    expense_row_dict,
+    json_default,
+    load_split_rows,
+    orjson,
+)
+
+
+def orm_to_dict():
+    """The original path: hydrate Expense/ExpenseSplit objects, then to_dict()"""
+    expenses = (
+        Expense.query.filter_by(group_id=DEFAULT_GROUP_ID)
+        .options(selectinload(Expense.splits))
+        .order_by(Expense.created_at.desc(), Expense.id.desc())
+        .all()
+    )
+    return json.dumps([expense.to_dict() for expense in expenses], sort_keys=True)
+
+
+def expense_rows():
+    rows = db.session.execute(
+        select(*EXPENSE_ROW_COLUMNS)
+        .where(Expense.group_id == DEFAULT_GROUP_ID)
+        .order_by(Expense.created_at.desc(), Expense.id.desc())
+    ).all()
+    splits_by_expense = load_split_rows([row.id for row in rows])
+    return [expense_row_dict(row, splits_by_expense[row.id]) for row in rows]
+
+
+def rows_stdlib():
+    return json.dumps(expense_rows(), default=json_default, sort_keys=True)
+
+
+def rows_provider():
+    return app.json.dumps(expense_rows())
+
+
+def run(size):
+    reset_schema()
+    seed_expenses(size)
+    db.session.remove()
+
+    provider = "rows + orjson" if orjson is not None else "rows + provider"
+    engines = [
+        ("orm + json", orm_to_dict),
+        ("rows + json", rows_stdlib),
+        (provider, rows_provider),
+    ]
+
+    rows = []
+    answers = []
+    for name, engine in engines:
+        best = None
+        for _ in range(3):
+            results = {}
+            with QueryCounter() as counter, timed(results, name):
+                payload = engine()
+            db.session.remove()
+            best = min(best or results[name], results[name])
+        answers.append(json.loads(payload))
+        rows.append(
+            [
+                size,
+                name,
+                counter.count,
+                f"{best * 1000:.1f}",
+                f"{size / best:.0f}",
+                f"{len(payload) / (1024 * 1024):.1f}",
+            ]
+        )
+    assert all(answer == answers[0] for answer in answers)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000", type=parse_sizes)
+    args = parser.parse_args()
+
+    rows = []
+    with app.app_context():
+        print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+        for size in args.sizes:
+            rows.extend(run(size))
+
+    print_table(["expenses", "path", "queries", "ms", "rows/s", "MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Streaming settlement benchmark
+
+Seeds the balance ledger with N people and compares the list-building
+greedy path (calculate_settlements) with the heap stream: time to the first
+page of transfers, time to drain every transfer, and peak Python memory.
+
+Usage:
+  python benchmarks/bench_settlement_stream.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import itertools
+import random
+import time
+import tracemalloc
+
+from common import app, db, parse_sizes, print_table, reset_schema
+
+from app import PersonBalance, calculate_settlements, iter_settlements_heap
+
+
+def seed_ledger(people, batch_size=10000, seed=42):
+    """Insert people ledger rows whose balances sum to zero"""
+    rng = random.Random(seed)
+    total = 0
+    for offset in range(0, people, batch_size):
+        rows = []
+        for i in range(offset, min(offset + batch_size, people)):
+            if i == people - 1:
+                cents = -total
+            else:
+                cents = rng.randint(-500000, 500000)
+            total += cents
+            rows.append(
+                {
+                    "person_name": f"Person{i}",
+                    "total_paid": max(cents, 0),
+                    "total_owed": max(-cents, 0),
+                }
+            )
+        db.session.execute(PersonBalance.__table__.insert(), rows)
+        db.session.commit()
+
+
+def measure(func):
+    """Return (seconds, peak MB) for one call"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000", type=parse_sizes)
+    parser.add_argument("--page-size", default=100, type=int)
+    args = parser.parse_args()
+
+    cases = [
+        ("greedy list", lambda: calculate_settlements("greedy")),
+        (
+            "heap first page",
+            lambda: list(itertools.islice(iter_settlements_heap(), args.page_size)),
+        ),
+        ("heap drain", lambda: sum(1 for _ in iter_settlements_heap())),
+    ]
+
+    rows = []
+    with app.app_context():
+        print(f"Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+        for size in args.sizes:
+            reset_schema()
+            seed_ledger(size)
+            for name, func in cases:
+                elapsed, peak = measure(func)
+                rows.append([size, name, f"{elapsed * 1000:.0f}", f"{peak:.1f}"])
+
+    print_table(["people", "mode", "ms", "peak MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
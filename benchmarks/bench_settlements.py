@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Settlement algorithm benchmark
+
+Generates random balance sets (pairwise debts in round amounts, so zero-sum
+subgroups occur naturally) and compares the number of transfers and the
+runtime of the greedy matcher and the exact minimum-transfer solver.
+
+Usage:
+  python benchmarks/bench_settlements.py --sizes 5,10,15,20 --trials 5
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from common import parse_sizes, print_table
+
+from app import settle_exact, settle_greedy
+
+
+def random_parties(people, rng):
+    """Return (debtors, creditors) built from random pairwise debts"""
+    balances = defaultdict(int)
+    names = [f"P{i}" for i in range(people)]
+    for _ in range(people):
+        lender, borrower = rng.sample(names, 2)
+        amount = rng.randint(1, 20) * 5000
+        balances[lender] += amount
+        balances[borrower] -= amount
+
+    debtors = [(name, -cents) for name, cents in balances.items() if cents < 0]
+    creditors = [(name, cents) for name, cents in balances.items() if cents > 0]
+    rng.shuffle(debtors)
+    rng.shuffle(creditors)
+    return debtors, creditors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="5,8,10,12,14,16,18,20", type=parse_sizes)
+    parser.add_argument("--trials", default=5, type=int)
+    parser.add_argument("--seed", default=7, type=int)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rows = []
+    for size in args.sizes:
+        greedy_count = exact_count = 0
+        greedy_time = exact_time = 0.0
+        for _ in range(args.trials):
+            debtors, creditors = random_parties(size, rng)
+
+            start = time.perf_counter()
+            greedy_count += len(settle_greedy(debtors, creditors))
+            greedy_time += time.perf_counter() - start
+
+            # No caps here, the point is to measure the full search
+            start = time.perf_counter()
+            exact_count += len(settle_exact(debtors, creditors, size, float("inf")))
+            exact_time += time.perf_counter() - start
+
+        rows.append(
+            [
+                size,
+                f"{greedy_count / args.trials:.1f}",
+                f"{exact_count / args.trials:.1f}",
+                f"{greedy_time / args.trials * 1000:.2f}",
+                f"{exact_time / args.trials * 1000:.1f}",
+            ]
+        )
+
+    print_table(
+        ["people", "greedy transfers", "exact transfers", "greedy ms", "exact ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Batch split calculation benchmark
+
+Generates expenses with two to six splits each (mostly equal, with exact and
+percentage splits mixed in, some of them invalid) until there are N splits,
+then validates and calculates them with calculate_split_batch() and with the
+scalar path, validate_splits() and calculate_split_amounts() one expense at a
+time. The scalar path only runs over the first --scalar-limit splits; the
+results of the two are checked to be identical there. No database is used.
+
+Usage:
+  python benchmarks/bench_split_batch.py --sizes 100000,1000000
+"""
+
+import argparse
+import random
+
+from common import parse_sizes, print_table, timed
+
+from app import (
+    SPLIT_EQUAL,
+    SPLIT_EXACT,
+    SPLIT_PERCENTAGE,
+    calculate_split_batch,
+    calculate_split_batch_scalar,
+    import_numpy,
+)
+
+
+def make_batch(size, people=200, seed=42):
+    """Flat split arrays for expenses adding up to size splits"""
+    rng = random.Random(seed)
+    totals = []
+    split_expense = []
+    split_person = []
+    split_type = []
+    split_value = []
+    while len(split_expense) < size:
+        total = rng.randint(100, 1000000)
+        count = rng.randint(2, 6)
+        index = len(totals)
+        totals.append(total)
+        for person in rng.sample(range(people), count):
+            roll = rng.random()
+            if roll < 0.15:
+                kind, value = SPLIT_EXACT, rng.randint(0, total // count)
+            elif roll < 0.3:
+                kind, value = SPLIT_PERCENTAGE, rng.choice([10, 12.5, 33.33, 50])
+            else:
+                kind, value = SPLIT_EQUAL, 0
+            split_expense.append(index)
+            split_person.append(person)
+            split_type.append(kind)
+            split_value.append(value)
+    return totals, split_expense, split_person, split_type, split_value
+
+
+def prefix(batch, limit):
+    """The expenses of batch whose splits all fall within the first limit"""
+    totals, split_expense, *columns = batch
+    end = min(limit, len(split_expense))
+    while 0 < end < len(split_expense) and split_expense[end] == split_expense[end - 1]:
+        end -= 1
+    count = split_expense[end - 1] + 1 if end else 0
+    return [totals[:count], split_expense[:end]] + [
+        column[:end] for column in columns
+    ]
+
+
+def run(size, scalar_limit):
+    batch = make_batch(size)
+    engine = "numpy" if import_numpy() is not None else "batch (no numpy)"
+    results = {}
+    with timed(results, engine):
+        amounts, valid = calculate_split_batch(*batch)
+    seconds = results[engine]
+    rows = [[size, engine, len(batch[0]), f"{seconds:.2f}", f"{size / seconds:.0f}"]]
+
+    sample = prefix(batch, scalar_limit)
+    with timed(results, "scalar"):
+        scalar_amounts, scalar_valid = calculate_split_batch_scalar(*sample)
+    splits = len(sample[1])
+    seconds = results["scalar"]
+    rows.append(
+        [splits, "scalar", len(sample[0]), f"{seconds:.2f}", f"{splits / seconds:.0f}"]
+    )
+
+    assert [int(amount) for amount in amounts[:splits]] == scalar_amounts
+    assert [bool(flag) for flag in valid[: len(sample[0])]] == scalar_valid
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100000,1000000", type=parse_sizes)
+    parser.add_argument(
+        "--scalar-limit",
+        default=100000,
+        type=int,
+        help="Run the scalar path over at most this many splits per size",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        rows.extend(run(size, args.scalar_limit))
+
+    print_table(["splits", "path", "expenses", "seconds", "splits/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark
+
+Seeds N expenses, then starts a fresh Python process per run that imports
+the app module, calls create_app() and serves its first requests (GET
+/people, then the dashboard) through the test client. Reports the median of
+each step and of the whole import-to-first-response time, the cost every
+gunicorn worker pays before it can answer.
+
+With --baseline REV the tree at that git revision is extracted to a temporary
+directory and timed the same way against the same database, for a before and
+after comparison. Revisions from before the create_app() factory use their
+module-level app. The revision must be able to read the current schema.
+
+Usage:
+  python benchmarks/bench_startup.py --runs 10
+  python benchmarks/bench_startup.py --baseline HEAD~1
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+from common import app, db, print_table, reset_schema, seed_expenses
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import app as module
+imported = time.perf_counter()
+app = module.create_app() if hasattr(module, "create_app") else module.app
+created = time.perf_counter()
+client = app.test_client()
+assert client.get("/people").status_code == 200
+first = time.perf_counter()
+assert client.get("/").status_code == 200
+dashboard = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "create_app": created - imported,
+    "first GET /people": first - created,
+    "first GET /": dashboard - first,
+    "import to first response": first - start,
+}))
+"""
+
+
+def extract_revision(rev, root):
+    """Write the tree of git revision rev into the directory root"""
+    archive = subprocess.run(
+        ["git", "archive", rev], cwd=ROOT, check=True, capture_output=True
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(root)
+
+
+def time_runs(root, env, runs):
+    """Time CHILD runs fresh processes importing the app from root"""
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD, root],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(output))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", default=10, type=int)
+    parser.add_argument("--expenses", default=1000, type=int)
+    parser.add_argument(
+        "--baseline", metavar="REV", help="Also time the tree at this git revision"
+    )
+    args = parser.parse_args()
+
+    with app.app_context():
+        reset_schema()
+        seed_expenses(args.expenses)
+        db.session.remove()
+        # Absolute, so a tree extracted elsewhere opens the same SQLite file
+        database_url = db.engine.url.render_as_string(hide_password=False)
+    print(f"Database: {database_url}")
+
+    env = dict(os.environ, DATABASE_URL=database_url)
+    columns = {"current": time_runs(ROOT, env, args.runs)}
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as root:
+            extract_revision(args.baseline, root)
+            columns = {args.baseline: time_runs(root, env, args.runs), **columns}
+
+    steps = list(columns["current"][0])
+    rows = [
+        [step]
+        + [
+            f"{statistics.median(run.get(step, 0.0) for run in runs) * 1000:.1f}"
+            for runs in columns.values()
+        ]
+        for step in steps
+    ]
+    print_table(["step"] + [f"{name} ms" for name in columns], rows)
+
+
+if __name__ == "__main__":
+    main()
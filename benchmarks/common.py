@@ -0,0 +1,149 @@
+"""
+Shared helpers for the benchmark scripts
+
+Benchmarks run against BENCH_DATABASE_URL (a throwaway SQLite file by
+default) and drop/recreate every table, so never point it at real data.
+"""
+
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+# Add the project root to Python path and keep benchmarks off DATABASE_URL
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL", "sqlite:///bench.db")
+
+from sqlalchemy import event  # noqa: E402
+
+from app import (  # noqa: E402
+    DEFAULT_GROUP_ID,
+    Expense,
+    ExpenseCategory,
+    ExpenseSplit,
+    add_rollup_delta,
+    apply_rollup_deltas,
+    create_app,
+    db,
+    ensure_default_group,
+    equal_shares,
+)
+
+CATEGORIES = list(ExpenseCategory)
+
+app = create_app()
+
+
+class QueryCounter:
+    """Count SQL statements sent to the database while active"""
+
+    def __init__(self):
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(db.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(db.engine, "before_cursor_execute", self._on_execute)
+
+
+@contextmanager
+def timed(results, key):
+    """Store the wall time of the block in results[key] (seconds)"""
+    start = time.perf_counter()
+    yield
+    results[key] = time.perf_counter() - start
+
+
+def reset_schema():
+    """Drop and recreate every table in the benchmark database"""
+    db.drop_all()
+    db.create_all()
+    ensure_default_group()
+
+
+def seed_expenses(
+    count,
+    people=50,
+    splits_per_expense=3,
+    batch_size=5000,
+    seed=42,
+    group_id=DEFAULT_GROUP_ID,
+    first_id=1,
+):
+    """Insert count expenses with equal splits (and their daily rollup rows)
+    using bulk core inserts"""
+    rng = random.Random(seed)
+    names = [f"Person{i}" for i in range(people)]
+    start = datetime(2020, 1, 1)
+    next_id = first_id
+
+    for offset in range(0, count, batch_size):
+        expense_rows = []
+        split_rows = []
+        rollup = {}
+        for expense_id in range(next_id, next_id + min(batch_size, count - offset)):
+            amount = rng.randint(100, 100000)  # cents
+            payer = rng.choice(names)
+            created_at = start + timedelta(minutes=rng.randint(0, 60 * 24 * 365 * 5))
+            expense_rows.append(
+                {
+                    "id": expense_id,
+                    "group_id": group_id,
+                    "amount": amount,
+                    "description": f"Expense {expense_id}",
+                    "paid_by": payer,
+                    "category": rng.choice(CATEGORIES),
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+            )
+            add_rollup_delta(
+                rollup,
+                group_id,
+                created_at,
+                expense_rows[-1]["category"],
+                payer,
+                amount,
+            )
+            participants = rng.sample(names, splits_per_expense)
+            shares = equal_shares(amount, splits_per_expense)
+            for person, share in zip(participants, shares):
+                split_rows.append(
+                    {
+                        "expense_id": expense_id,
+                        "group_id": group_id,
+                        "person_name": person,
+                        "split_type": "equal",
+                        "split_value": None,
+                        "calculated_amount": share,
+                    }
+                )
+        db.session.execute(Expense.__table__.insert(), expense_rows)
+        db.session.execute(ExpenseSplit.__table__.insert(), split_rows)
+        apply_rollup_deltas(rollup)
+        db.session.commit()
+        next_id += len(expense_rows)
+
+
+def parse_sizes(value):
+    """Parse a comma separated list of sizes such as '10000,100000'"""
+    return [int(size) for size in value.split(",") if size]
+
+
+def print_table(headers, rows):
+    """Print rows as an aligned plain-text table"""
+    widths = [
+        max(len(str(header)), *(len(str(row[i])) for row in rows))
+        for i, header in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
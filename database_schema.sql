@@ -1,15 +1,33 @@
 -- Expense Splitter Database Schema
 -- This file documents the database structure for reference
+-- Groups table - independent households/trips, each with its own ledger
+CREATE TABLE expense_group (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    -- bumped by every write to the group, used to invalidate its caches
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
 -- People table - stores all individuals involved in expenses
 CREATE TABLE person (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name VARCHAR(100) NOT NULL UNIQUE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+-- Group members table - who belongs to which group
+CREATE TABLE group_member (
+    group_id INTEGER NOT NULL,
+    person_id INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (group_id, person_id),
+    FOREIGN KEY (group_id) REFERENCES expense_group(id),
+    FOREIGN KEY (person_id) REFERENCES person(id)
+);
 -- Recurring transactions table - templates for recurring expenses
 CREATE TABLE recurring_transaction (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    amount DECIMAL(10, 2) NOT NULL,
+    group_id INTEGER NOT NULL DEFAULT 1,
+    amount BIGINT NOT NULL, -- cents
     description VARCHAR(255) NOT NULL,
     paid_by VARCHAR(100) NOT NULL,
     category VARCHAR(20) DEFAULT 'Other',
@@ -18,49 +36,96 @@ CREATE TABLE recurring_transaction (
     start_date TIMESTAMP NOT NULL,
     end_date TIMESTAMP,
     last_generated TIMESTAMP,
+    next_due TIMESTAMP,
+    -- next occurrence to generate
     is_active BOOLEAN DEFAULT TRUE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (group_id) REFERENCES expense_group(id)
 );
 -- Expenses table - individual expense records
 CREATE TABLE expense (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    amount DECIMAL(10, 2) NOT NULL,
+    group_id INTEGER NOT NULL DEFAULT 1,
+    amount BIGINT NOT NULL, -- cents
     description VARCHAR(255) NOT NULL,
     paid_by VARCHAR(100) NOT NULL,
     category VARCHAR(20) DEFAULT 'Other',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     recurring_transaction_id INTEGER,
+    FOREIGN KEY (group_id) REFERENCES expense_group(id),
     FOREIGN KEY (recurring_transaction_id) REFERENCES recurring_transaction(id)
 );
 -- Expense splits table - defines how each expense is split among people
 CREATE TABLE expense_split (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     expense_id INTEGER NOT NULL,
+    group_id INTEGER NOT NULL DEFAULT 1,
+    -- copied from the expense so balances can be aggregated per group
     person_name VARCHAR(100) NOT NULL,
     split_type VARCHAR(20) NOT NULL,
     -- 'equal', 'percentage', 'exact'
     split_value DECIMAL(10, 2),
     -- percentage value or exact amount (null for equal)
-    calculated_amount DECIMAL(10, 2) NOT NULL,
-    -- final amount this person owes
-    FOREIGN KEY (expense_id) REFERENCES expense(id) ON DELETE CASCADE
+    calculated_amount BIGINT NOT NULL,
+    -- final amount this person owes, in cents
+    FOREIGN KEY (expense_id) REFERENCES expense(id) ON DELETE CASCADE,
+    FOREIGN KEY (group_id) REFERENCES expense_group(id)
+);
+-- Person balances table - running totals per group member kept in sync by
+-- every expense write
+CREATE TABLE person_balance (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_id INTEGER NOT NULL DEFAULT 1,
+    person_name VARCHAR(100) NOT NULL,
+    total_paid BIGINT NOT NULL DEFAULT 0, -- cents
+    total_owed BIGINT NOT NULL DEFAULT 0, -- cents
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (group_id, person_name),
+    FOREIGN KEY (group_id) REFERENCES expense_group(id)
+);
+-- Daily rollup table - expense totals per group, day, category and payer,
+-- kept in sync by every expense write and read by the analytics endpoints
+CREATE TABLE daily_rollup (
+    group_id INTEGER NOT NULL,
+    day DATE NOT NULL,
+    category VARCHAR(20) NOT NULL,
+    paid_by VARCHAR(100) NOT NULL,
+    total_amount BIGINT NOT NULL DEFAULT 0, -- cents
+    expense_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (group_id, day, category, paid_by),
+    FOREIGN KEY (group_id) REFERENCES expense_group(id)
+) WITHOUT ROWID;
+-- Data version table - single row bumped by every write to invalidate caches
+CREATE TABLE data_version (
+    id INTEGER PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
 );
 -- Indexes for better performance
 CREATE INDEX idx_expense_paid_by ON expense(paid_by);
 CREATE INDEX idx_expense_category ON expense(category);
 CREATE INDEX idx_expense_created_at ON expense(created_at);
+CREATE INDEX ix_expense_group_created_at_id ON expense(group_id, created_at, id);
+CREATE INDEX ix_expense_group_created_at_category ON expense(group_id, created_at, category, amount);
+CREATE INDEX ix_expense_recurring_transaction_id ON expense(recurring_transaction_id);
 CREATE INDEX idx_expense_split_expense_id ON expense_split(expense_id);
 CREATE INDEX idx_expense_split_person_name ON expense_split(person_name);
+CREATE INDEX ix_expense_split_group_person ON expense_split(group_id, person_name);
 CREATE INDEX idx_recurring_transaction_paid_by ON recurring_transaction(paid_by);
 CREATE INDEX idx_recurring_transaction_is_active ON recurring_transaction(is_active);
+CREATE INDEX ix_recurring_transaction_active_next_due ON recurring_transaction(is_active, next_due);
+CREATE INDEX ix_recurring_transaction_group_id ON recurring_transaction(group_id, id);
 -- Sample data for testing (optional)
 -- Run these INSERT statements to populate with test data
--- Insert sample people
+-- Insert the default group and sample people
+INSERT INTO expense_group (id, name)
+VALUES (1, 'Default');
 INSERT INTO person (name)
 VALUES ('Shantanu'),
     ('Sanket'),
     ('Om');
+INSERT INTO group_member (group_id, person_id)
+SELECT 1, id FROM person;
 -- Insert sample expenses with splits
 -- (Note: In the actual application, this is handled by the Python code)
 /*
@@ -94,6 +159,8 @@ VALUES ('Shantanu'),
  - Priority: Exact amounts → Percentages → Equal splits
  - Remaining amount after exact/percentage is split equally
  - Validation ensures totals don't exceed 100%
+ - Money columns hold integer cents; leftover cents go to the largest
+   fractional remainders so splits add up to the expense exactly
  
  6. **Settlement Algorithm**:
  - Calculates net balance for each person (paid - owes)
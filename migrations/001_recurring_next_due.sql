@@ -0,0 +1,6 @@
+-- Add the indexed next_due column used to select only due recurring templates.
+-- Existing rows keep next_due NULL; the next generation run fills it in from
+-- last_generated/start_date.
+ALTER TABLE recurring_transaction ADD COLUMN next_due TIMESTAMP;
+CREATE INDEX ix_recurring_transaction_active_next_due
+    ON recurring_transaction (is_active, next_due);
@@ -0,0 +1,3 @@
+-- Composite index backing keyset pagination of GET /expenses
+-- (ORDER BY created_at DESC, id DESC with a (created_at, id) cursor).
+CREATE INDEX ix_expense_created_at_id ON expense (created_at, id);
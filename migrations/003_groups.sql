@@ -0,0 +1,39 @@
+-- Partition data by group. Every existing row goes into the default group
+-- (id 1) and every existing person becomes a member of it.
+CREATE TABLE expense_group (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+INSERT INTO expense_group (id, name) VALUES (1, 'Default');
+
+CREATE TABLE group_member (
+    group_id INTEGER NOT NULL REFERENCES expense_group(id),
+    person_id INTEGER NOT NULL REFERENCES person(id),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (group_id, person_id)
+);
+INSERT INTO group_member (group_id, person_id) SELECT 1, id FROM person;
+
+ALTER TABLE expense ADD COLUMN group_id INTEGER NOT NULL DEFAULT 1 REFERENCES expense_group(id);
+ALTER TABLE expense_split ADD COLUMN group_id INTEGER NOT NULL DEFAULT 1 REFERENCES expense_group(id);
+ALTER TABLE recurring_transaction ADD COLUMN group_id INTEGER NOT NULL DEFAULT 1 REFERENCES expense_group(id);
+
+DROP INDEX ix_expense_created_at_id;
+CREATE INDEX ix_expense_group_created_at_id ON expense (group_id, created_at, id);
+CREATE INDEX ix_expense_split_group_person ON expense_split (group_id, person_name);
+CREATE INDEX ix_recurring_transaction_group_id ON recurring_transaction (group_id, id);
+
+-- The ledger is now keyed by (group_id, person_name). It only holds derived
+-- totals, so recreate it and run `flask rebuild-ledger` afterwards.
+DROP TABLE person_balance;
+CREATE TABLE person_balance (
+    id INTEGER PRIMARY KEY,
+    group_id INTEGER NOT NULL DEFAULT 1 REFERENCES expense_group(id),
+    person_name VARCHAR(100) NOT NULL,
+    total_paid DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    total_owed DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_person_balance_group_person UNIQUE (group_id, person_name)
+);
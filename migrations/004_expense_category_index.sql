@@ -0,0 +1,3 @@
+-- Covering index for /analytics/categories: the created_at window is a
+-- range scan and category/amount are read from the index, not the table.
+CREATE INDEX ix_expense_group_created_at_category ON expense (group_id, created_at, category, amount);
@@ -0,0 +1,13 @@
+-- Daily totals per group, day, category and payer read by the analytics
+-- endpoints. Every expense write keeps it up to date; fill it for existing
+-- data with `flask --app app rebuild-rollup` after applying this file.
+-- On SQLite, use VARCHAR(13) for category and append WITHOUT ROWID.
+CREATE TABLE daily_rollup (
+    group_id INTEGER NOT NULL REFERENCES expense_group(id),
+    day DATE NOT NULL,
+    category expensecategory NOT NULL,
+    paid_by VARCHAR(100) NOT NULL,
+    total_amount DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    expense_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (group_id, day, category, paid_by)
+);
@@ -0,0 +1,3 @@
+-- Index for GET /recurring, which counts generated expenses per template
+-- with one GROUP BY recurring_transaction_id instead of loading them.
+CREATE INDEX ix_expense_recurring_transaction_id ON expense (recurring_transaction_id);
@@ -0,0 +1,41 @@
+-- Store every money column as a BIGINT count of cents instead of
+-- NUMERIC(10, 2)/(14, 2). split_value keeps its numeric type because it
+-- holds the percentage or exact amount as entered.
+-- PostgreSQL only; on SQLite run 007_integer_cents_sqlite.sql instead.
+BEGIN;
+
+ALTER TABLE expense
+    ALTER COLUMN amount TYPE BIGINT USING round(amount * 100)::bigint;
+ALTER TABLE expense_split
+    ALTER COLUMN calculated_amount TYPE BIGINT
+    USING round(calculated_amount * 100)::bigint;
+ALTER TABLE recurring_transaction
+    ALTER COLUMN amount TYPE BIGINT USING round(amount * 100)::bigint;
+ALTER TABLE person_balance
+    ALTER COLUMN total_paid TYPE BIGINT USING round(total_paid * 100)::bigint,
+    ALTER COLUMN total_owed TYPE BIGINT USING round(total_owed * 100)::bigint;
+ALTER TABLE daily_rollup
+    ALTER COLUMN total_amount TYPE BIGINT USING round(total_amount * 100)::bigint;
+
+-- Splits used to be rounded one by one, so some expenses are off by a cent
+-- or two. Give the rounding residual (never more than one cent per split)
+-- to each such expense's first split.
+UPDATE expense_split
+SET calculated_amount = expense_split.calculated_amount + residual.cents
+FROM (
+    SELECT e.id AS expense_id,
+           e.amount - sum(s.calculated_amount) AS cents,
+           min(s.id) AS split_id
+    FROM expense e
+    JOIN expense_split s ON s.expense_id = e.id
+    GROUP BY e.id, e.amount
+    HAVING e.amount <> sum(s.calculated_amount)
+       AND abs(e.amount - sum(s.calculated_amount)) < count(*)
+) AS residual
+WHERE expense_split.id = residual.split_id;
+
+COMMIT;
+
+-- Then rebuild the totals from the corrected rows:
+--   flask --app app rebuild-ledger
+--   flask --app app rebuild-rollup
@@ -0,0 +1,38 @@
+-- SQLite version of 007_integer_cents.sql. SQLite cannot alter column
+-- types, but its NUMERIC columns store whole numbers as integers, so
+-- converting the values in place is enough.
+BEGIN;
+
+UPDATE expense SET amount = CAST(round(amount * 100) AS INTEGER);
+UPDATE expense_split
+SET calculated_amount = CAST(round(calculated_amount * 100) AS INTEGER);
+UPDATE recurring_transaction SET amount = CAST(round(amount * 100) AS INTEGER);
+UPDATE person_balance
+SET total_paid = CAST(round(total_paid * 100) AS INTEGER),
+    total_owed = CAST(round(total_owed * 100) AS INTEGER);
+UPDATE daily_rollup
+SET total_amount = CAST(round(total_amount * 100) AS INTEGER);
+
+-- Give each expense's rounding residual to its first split, as in the
+-- PostgreSQL migration (without UPDATE ... FROM, which older SQLite lacks)
+UPDATE expense_split
+SET calculated_amount = calculated_amount + (
+    SELECT e.amount - sum(s.calculated_amount)
+    FROM expense e
+    JOIN expense_split s ON s.expense_id = e.id
+    WHERE e.id = expense_split.expense_id
+)
+WHERE id IN (
+    SELECT min(s.id)
+    FROM expense e
+    JOIN expense_split s ON s.expense_id = e.id
+    GROUP BY e.id, e.amount
+    HAVING e.amount <> sum(s.calculated_amount)
+       AND abs(e.amount - sum(s.calculated_amount)) < count(*)
+);
+
+COMMIT;
+
+-- Then rebuild the totals from the corrected rows:
+--   flask --app app rebuild-ledger
+--   flask --app app rebuild-rollup
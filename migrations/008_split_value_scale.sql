@@ -0,0 +1,10 @@
+-- Keep split_value to 4 decimal places (NUMERIC(14, 4) instead of
+-- NUMERIC(10, 2)), so a percentage such as 33.333 is stored as entered and
+-- the split reproduces its calculated amount. Exact amounts keep their range.
+-- PostgreSQL only. SQLite ignores declared numeric precision and already
+-- stores the values as entered, so it needs no change.
+BEGIN;
+
+ALTER TABLE expense_split ALTER COLUMN split_value TYPE NUMERIC(14, 4);
+
+COMMIT;
@@ -6,7 +6,6 @@ Handles database initialization and sample data loading
 
 import os
 import sys
-from decimal import Decimal
 from datetime import datetime
 
 # Add the current directory to Python path
@@ -15,14 +14,18 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 def setup_database():
     """Initialize database with tables and sample data"""
     try:
-        from app import app, db, Person, Expense, ExpenseSplit, RecurringTransaction
+        from app import create_app, db, Person, Expense, ExpenseSplit, RecurringTransaction
         from app import ExpenseCategory, RecurrenceType, get_or_create_person
+        from app import calculate_split_amounts, to_cents
+        from app import delete_all_data, ensure_default_group, rebuild_ledger, rebuild_rollup
         
         print("🔄 Setting up database...")
         
+        app = create_app()
         with app.app_context():
             # Create all tables
             db.create_all()
+            ensure_default_group()
             print("✅ Database tables created")
             
             # Check if data already exists
@@ -35,10 +38,7 @@ def setup_database():
                 
                 # Clear existing data
                 print("🧹 Clearing existing data...")
-                ExpenseSplit.query.delete()
-                Expense.query.delete()
-                RecurringTransaction.query.delete()
-                Person.query.delete()
+                delete_all_data()
                 db.session.commit()
             
             # Create sample data
@@ -113,7 +113,7 @@ def setup_database():
                 
                 # Create expense
                 expense = Expense(
-                    amount=Decimal(str(expense_data['amount'])),
+                    amount=to_cents(expense_data['amount']),
                     description=expense_data['description'],
                     paid_by=expense_data['paid_by'],
                     category=ExpenseCategory(expense_data['category'])
@@ -121,57 +121,21 @@ def setup_database():
                 db.session.add(expense)
                 db.session.flush()
                 
-                # Calculate and create splits
-                total_amount = Decimal(str(expense_data['amount']))
-                remaining_amount = total_amount
-                equal_splits = []
-                
-                # First pass: handle exact and percentage splits
-                for split in expense_data['splits']:
-                    if split['type'] == 'exact':
-                        amount = Decimal(str(split['value']))
-                        split_record = ExpenseSplit(
-                            expense_id=expense.id,
-                            person_name=split['person'],
-                            split_type='exact',
-                            split_value=split['value'],
-                            calculated_amount=amount
-                        )
-                        db.session.add(split_record)
-                        remaining_amount -= amount
-                        
-                    elif split['type'] == 'percentage':
-                        percentage = Decimal(str(split['value']))
-                        amount = total_amount * percentage / 100
-                        split_record = ExpenseSplit(
-                            expense_id=expense.id,
-                            person_name=split['person'],
-                            split_type='percentage',
-                            split_value=split['value'],
-                            calculated_amount=amount
-                        )
-                        db.session.add(split_record)
-                        remaining_amount -= amount
-                        
-                    elif split['type'] == 'equal':
-                        equal_splits.append(split['person'])
-                
-                # Second pass: handle equal splits
-                if equal_splits:
-                    equal_amount = remaining_amount / len(equal_splits)
-                    for person in equal_splits:
-                        split_record = ExpenseSplit(
-                            expense_id=expense.id,
-                            person_name=person,
-                            split_type='equal',
-                            split_value=None,
-                            calculated_amount=equal_amount
-                        )
-                        db.session.add(split_record)
+                # Calculate splits in cents; they add up to the expense exactly
+                splits = [
+                    {
+                        'person_name': split['person'],
+                        'split_type': split['type'],
+                        'split_value': split.get('value')
+                    }
+                    for split in expense_data['splits']
+                ]
+                for split in calculate_split_amounts(expense_data['amount'], splits):
+                    db.session.add(ExpenseSplit(expense_id=expense.id, **split))
             
             # Create sample recurring transaction
             recurring = RecurringTransaction(
-                amount=Decimal('15000'),
+                amount=to_cents(15000),
                 description='Monthly Rent',
                 paid_by='Shantanu',
                 category=ExpenseCategory.UTILITIES,
@@ -183,6 +147,10 @@ def setup_database():
             
             db.session.commit()
             
+            # Build the balance ledger and analytics rollup from the rows created above
+            rebuild_ledger()
+            rebuild_rollup()
+            
             print("✅ Sample data created successfully!")
             print(f"📊 Created {Person.query.count()} people")
             print(f"💰 Created {Expense.query.count()} expenses")
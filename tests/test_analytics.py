@@ -0,0 +1,30 @@
+"""Query argument errors of the analytics endpoints"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db, init_db  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
+    with app.app_context():
+        init_db()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.mark.parametrize("path", ["/analytics/categories", "/analytics/people"])
+@pytest.mark.parametrize("arg", ["start_date", "end_date"])
+def test_malformed_date_is_a_bad_request(client, path, arg):
+    response = client.get(path, query_string={arg: "not-a-date"})
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body["success"] is False
+    assert body["message"].startswith("Invalid date")
@@ -0,0 +1,158 @@
+"""Balances from the SQL aggregates, the ledger and a walk over ORM objects"""
+
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (  # noqa: E402
+    DEFAULT_GROUP_ID,
+    Expense,
+    aggregate_balances,
+    backfill_expense_splits,
+    calculate_balances,
+    create_app,
+    db,
+    equal_shares,
+    format_balance,
+    init_db,
+    rebuild_ledger,
+)
+
+
+@pytest.fixture
+def client():
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
+    with app.app_context():
+        init_db()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+def orm_walk_balances(group_id=DEFAULT_GROUP_ID):
+    """The balances the way they were computed before the aggregates: every
+    expense and its splits loaded as objects, and split-less (legacy) expenses
+    shared equally among everyone involved in any expense of the group"""
+    expenses = Expense.query.filter_by(group_id=group_id).order_by(Expense.id).all()
+    involved = set()
+    for expense in expenses:
+        involved.add(expense.paid_by)
+        involved.update(row.person_name for row in expense.splits)
+    involved = sorted(involved)
+
+    paid = defaultdict(int)
+    owed = defaultdict(int)
+    for expense in expenses:
+        paid[expense.paid_by] += expense.amount
+        if expense.splits:
+            shares = [
+                (row.person_name, row.calculated_amount) for row in expense.splits
+            ]
+        else:
+            shares = zip(involved, equal_shares(expense.amount, len(involved)))
+        for person, amount in shares:
+            owed[person] += amount
+    return {
+        person: format_balance(paid[person], owed[person])
+        for person in set(paid) | set(owed)
+        if paid[person] or owed[person]
+    }
+
+
+def split(person_name, split_type="equal", split_value=None):
+    return {
+        "person_name": person_name,
+        "split_type": split_type,
+        "split_value": split_value,
+    }
+
+
+def add_expenses(client, group_id=None):
+    """Mixed equal, percentage and exact splits, and an expense without any,
+    added one by one and again in bulk"""
+    expenses = [
+        {
+            "amount": 100,
+            "description": "Dinner",
+            "paid_by": "Ann",
+            "splits": [split("Ann"), split("Bob"), split("Cat")],
+        },
+        {
+            "amount": 1000,
+            "description": "Hotel",
+            "paid_by": "Bob",
+            "splits": [
+                split("Ann", "percentage", 33.333),
+                split("Bob", "exact", 250.5),
+                split("Cat"),
+                split("Dan"),
+            ],
+        },
+        {"amount": 12.34, "description": "Snacks", "paid_by": "Cat"},
+        {
+            "amount": 0.05,
+            "description": "Gum",
+            "paid_by": "Dan",
+            "splits": [split("Ann"), split("Bob")],
+        },
+    ]
+    for expense in expenses:
+        if group_id is not None:
+            expense["group_id"] = group_id
+        assert client.post("/expenses", json=expense).status_code == 201
+
+    response = client.post(
+        "/expenses/bulk", json={"group_id": group_id, "expenses": expenses}
+    )
+    assert response.status_code == 201
+    assert response.get_json()["data"]["failed"] == 0
+
+
+def add_legacy_expenses(group_id=DEFAULT_GROUP_ID):
+    """Expenses written before splits were stored: no split rows, no ledger"""
+    for amount, paid_by in [(1001, "Ann"), (7, "Eve"), (250000, "Cat")]:
+        db.session.add(
+            Expense(
+                group_id=group_id,
+                amount=amount,
+                description="Legacy",
+                paid_by=paid_by,
+                created_at=datetime(2023, 1, 1),
+            )
+        )
+    db.session.commit()
+
+
+def test_aggregates_and_ledger_match_the_orm_walk(client):
+    response = client.post("/groups", json={"name": "Trip", "members": ["Ann"]})
+    trip = response.get_json()["data"]["id"]
+    add_expenses(client)
+    add_expenses(client, trip)
+
+    assert rebuild_ledger(verify_only=True) == []
+    for group_id in (DEFAULT_GROUP_ID, trip):
+        expected = orm_walk_balances(group_id)
+        assert expected
+        assert aggregate_balances(group_id) == expected
+        assert calculate_balances(group_id) == expected
+
+
+def test_backfilled_legacy_expenses_match_the_orm_walk(client):
+    add_expenses(client)
+    add_legacy_expenses()
+    expected = orm_walk_balances()
+
+    # The ledger never saw the legacy expenses until they are backfilled
+    assert rebuild_ledger(verify_only=True)
+    list(backfill_expense_splits(batch_size=2))
+    rebuild_ledger()
+
+    assert rebuild_ledger(verify_only=True) == []
+    assert aggregate_balances() == expected
+    assert calculate_balances() == expected
+    assert orm_walk_balances() == expected
@@ -0,0 +1,79 @@
+"""Cached group results after group ids are reused"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (  # noqa: E402
+    Group,
+    create_app,
+    db,
+    delete_all_data,
+    get_data_version,
+    init_db,
+)
+
+
+@pytest.fixture
+def client():
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
+    with app.app_context():
+        init_db()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+def add_group(client, paid_by, other):
+    response = client.post("/groups", json={"name": "Trip", "members": [paid_by]})
+    group_id = response.get_json()["data"]["id"]
+    expense = {
+        "amount": 100,
+        "description": "Taxi",
+        "paid_by": paid_by,
+        "group_id": group_id,
+        "splits": [
+            {"person_name": paid_by, "split_type": "equal"},
+            {"person_name": other, "split_type": "equal"},
+        ],
+    }
+    assert client.post("/expenses", json=expense).status_code == 201
+    return group_id
+
+
+def read_group(client, group_id):
+    balances = client.get("/balances", query_string={"group_id": group_id})
+    settlements = client.get("/settlements", query_string={"group_id": group_id})
+    dashboard = client.get("/", query_string={"group_id": group_id})
+    return (
+        sorted(balances.get_json()["data"]),
+        settlements.get_json()["data"],
+        dashboard.get_data(as_text=True),
+    )
+
+
+def test_reused_group_id_does_not_serve_the_deleted_groups_results(client):
+    group_id = add_group(client, "Ann", "Bob")
+    old_version = get_data_version(group_id)
+    balances, settlements, _ = read_group(client, group_id)
+    assert balances == ["Ann", "Bob"]
+
+    # Another worker cleans the database, so this one's caches are not cleared
+    delete_all_data()
+    db.session.commit()
+
+    assert add_group(client, "Cat", "Dan") == group_id
+    # Even a group version equal to the deleted group's must not match
+    db.session.query(Group).filter_by(id=group_id).update(
+        {Group.version: old_version[1]}
+    )
+    db.session.commit()
+    assert get_data_version(group_id) != old_version
+
+    balances, settlements, dashboard = read_group(client, group_id)
+    assert balances == ["Cat", "Dan"]
+    assert [(s["from"], s["to"]) for s in settlements] == [("Dan", "Cat")]
+    assert "Cat" in dashboard and "Ann" not in dashboard
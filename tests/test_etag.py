@@ -0,0 +1,76 @@
+"""ETags of GET responses"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+from app import create_app, db, init_db  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
+    with app.app_context():
+        init_db()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+def test_creating_a_group_changes_the_group_list_etag(client):
+    etag = client.get("/groups").headers["ETag"]
+    assert client.get("/groups", headers={"If-None-Match": etag}).status_code == 304
+
+    response = client.post("/groups", json={"name": "Trip", "members": ["Ann"]})
+    assert response.status_code == 201
+
+    response = client.get("/groups", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [group["name"] for group in response.get_json()["data"]] == [
+        "Default",
+        "Trip",
+    ]
+
+
+def test_reused_group_id_gets_a_new_etag(client):
+    response = client.post("/groups", json={"name": "Trip", "members": ["Ann"]})
+    group_id = response.get_json()["data"]["id"]
+    etag = client.get("/balances", query_string={"group_id": group_id}).headers["ETag"]
+
+    assert client.post("/admin/clean-db").status_code == 200
+    response = client.post("/groups", json={"name": "Trip", "members": ["Bob"]})
+    assert response.get_json()["data"]["id"] == group_id
+
+    response = client.get(
+        "/balances",
+        query_string={"group_id": group_id},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_escaped_query_arguments_get_their_own_etag(client):
+    plain = client.get("/expenses?paid_by=Ann&start_date=2024-01-01")
+    escaped = client.get("/expenses?paid_by=Ann%26start_date%3D2024-01-01")
+    assert plain.status_code == escaped.status_code == 200
+    assert plain.headers["ETag"] != escaped.headers["ETag"]
+
+
+def test_monthly_analytics_etag_changes_with_the_year(client, monkeypatch):
+    class NextYear(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz).replace(year=datetime.now(tz).year + 1)
+
+    etag = client.get("/analytics/monthly").headers["ETag"]
+    monkeypatch.setattr(app_module, "datetime", NextYear)
+    response = client.get("/analytics/monthly", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,155 @@
+"""calculate_split_batch() against the scalar split functions"""
+
+import os
+import random
+import sys
+from decimal import Decimal
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (  # noqa: E402
+    SPLIT_TYPES,
+    calculate_split_amounts,
+    calculate_split_batch,
+    calculate_split_batch_scalar,
+    from_cents,
+    to_cents,
+    validate_splits,
+)
+
+pytest.importorskip("numpy")
+
+# (total in cents, [(split type, value)]); exact values are in rupees and
+# percentages in percent, as POST /expenses takes them
+EDGE_CASES = [
+    (100, [("equal", None)] * 3),
+    (1, [("equal", None)] * 3),
+    (200, [("equal", None)] * 3),
+    (100000, [("percentage", 33.333)] * 3),
+    (250000, [("percentage", 33.333)] * 3),
+    (250000, [("percentage", "33.3333")] * 2 + [("percentage", "33.3334")]),
+    (250000, [("percentage", "33.33333")] * 2 + [("percentage", "33.33334")]),
+    (10000, [("percentage", 33.333), ("equal", None), ("equal", None)]),
+    (10000, [("percentage", 12.345), ("percentage", 87.655)]),
+    (10000, [("percentage", 100)]),
+    (10000, [("percentage", 50), ("percentage", 50.01)]),
+    (1001, [("percentage", 33.33), ("exact", 3), ("equal", None)]),
+    (10000, [("exact", 100)]),
+    (10000, [("exact", 33.33), ("exact", 33.33), ("exact", 33.34)]),
+    (10000, [("exact", 60), ("exact", 50)]),
+    (0, [("equal", None)] * 2),
+    (0, [("percentage", 50), ("percentage", 50)]),
+    (10000, [("exact", 0), ("equal", None)]),
+    (10000, [("percentage", 0), ("equal", None)]),
+    (10000, [("exact", 100), ("equal", None)]),
+    (10000, [("percentage", 1e300), ("equal", None)]),
+    (10000, [("percentage", "abc"), ("equal", None)]),
+]
+
+
+def random_cases(seed, count=200):
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        total = rng.choice([rng.randint(1, 1000000), rng.randint(0, 10), 10**15])
+        splits = []
+        for _ in range(rng.randint(1, 6)):
+            roll = rng.random()
+            if roll < 0.2:
+                cents = rng.randint(0, max(1, total // 3))
+                splits.append(("exact", from_cents(cents)))
+            elif roll < 0.45:
+                value = rng.choice([10, 12.5, 25, 33.33, 33.333, "33.3333", 50])
+                splits.append(("percentage", value))
+            else:
+                splits.append(("equal", None))
+        cases.append((total, splits))
+    return cases
+
+
+def scalar_result(total, splits):
+    """(amounts in input order, valid) from validate_splits() and
+    calculate_split_amounts(); invalid expenses get all 0"""
+    specs = [
+        {"person_name": f"p{i}", "split_type": kind, "split_value": value}
+        for i, (kind, value) in enumerate(splits)
+    ]
+    amount = from_cents(total)
+    if total <= 0 or validate_splits(specs, amount):
+        return [0] * len(splits), False
+    amounts = {
+        split["person_name"]: split["calculated_amount"]
+        for split in calculate_split_amounts(amount, specs)
+    }
+    return [amounts[spec["person_name"]] for spec in specs], True
+
+
+def batch_arrays(cases):
+    """The flat arrays calculate_split_batch() takes for a list of cases"""
+    totals = []
+    columns = ([], [], [], [])
+    for index, (total, splits) in enumerate(cases):
+        totals.append(total)
+        for person, (kind, value) in enumerate(splits):
+            code = SPLIT_TYPES.index(kind)
+            if kind == "exact":
+                value = to_cents(value)
+            elif kind == "equal":
+                value = 0
+            for column, item in zip(columns, (index, person, code, value)):
+                column.append(item)
+    return [totals, *columns]
+
+
+def check(cases):
+    arrays = batch_arrays(cases)
+    amounts, valid = calculate_split_batch(*arrays)
+    scalar_amounts, scalar_valid = calculate_split_batch_scalar(*arrays)
+    assert [int(amount) for amount in amounts] == scalar_amounts
+    assert [bool(flag) for flag in valid] == scalar_valid
+
+    position = 0
+    for index, (total, splits) in enumerate(cases):
+        row = [int(amount) for amount in amounts[position : position + len(splits)]]
+        assert (row, bool(valid[index])) == scalar_result(total, splits), (
+            total,
+            splits,
+        )
+        position += len(splits)
+
+
+@pytest.mark.parametrize("case", EDGE_CASES)
+def test_edge_case_matches_the_scalar_path(case):
+    check([case])
+
+
+def test_edge_cases_in_one_batch():
+    check(EDGE_CASES)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_batch_matches_the_scalar_path(seed):
+    check(random_cases(seed))
+
+
+def test_largest_remainders_and_exact_percentages():
+    amounts, valid = calculate_split_batch(
+        [100, 10000, 250000],
+        [0, 0, 0, 1, 1, 2, 2, 2],
+        [0, 1, 2, 0, 1, 0, 1, 2],
+        [0, 0, 0, 1, 1, 1, 1, 1],
+        [0, 0, 0, 12.345, 87.655, Decimal("33.3333"), "33.3333", 33.3334],
+    )
+    assert [int(amount) for amount in amounts] == [
+        34,
+        33,
+        33,
+        1235,
+        8765,
+        83333,
+        83333,
+        83334,
+    ]
+    assert [bool(flag) for flag in valid] == [True, True, True]